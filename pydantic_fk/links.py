@@ -1,7 +1,8 @@
 
-from copy import deepcopy
-from typing import Any, Optional, TypeAlias, Union
-from typing import cast, get_args, get_origin
+from copy import copy
+from sys import intern
+from typing import Annotated, Any, ForwardRef, Iterator, Optional, TypeAlias, Union
+from typing import cast, get_origin
 from typing import TYPE_CHECKING
 
 from pydantic import BaseModel
@@ -10,32 +11,61 @@ from pydantic.fields import FieldInfo
 from pydantic._internal import _model_construction
 
 if TYPE_CHECKING:
-    from pydantic._internal import _generics, _decorators
+    from pydantic._internal import _generics
 
 
-ModelValidatorFunc: TypeAlias = (
-    "_decorators.PydanticDescriptorProxy["
-    "_decorators.ModelValidatorDecoratorInfo]")
+FieldMappings: TypeAlias = tuple[tuple[str, str], ...]
+
+LinkPlan: TypeAlias = tuple[tuple[str, str, FieldMappings], ...]
+
+# Container origins whose arguments are searched for BaseModel types.
+_CONTAINER_ORIGINS = frozenset((list, dict, set, tuple, frozenset))
+
+# Sentinel for missing values, so None can still be a copied value.
+_MISSING = object()
 
 
 def _get_source_value(source: Any, field_name: str) -> tuple[bool, Any]:
     """
     Get a field data from a specific source.
 
-    :param source: Could either be a dictionary or a model instance.
+    :param source: Could either be a dictionary or a model instance, any
+        other object is looked up by attribute.
     :param field_name: Field name to extract value from.
 
     :returns: A tuple containing a boolean as first item indicating if value
         exist in the source object, and the extracted value itself as second
         item.
     """
-    if isinstance(source, dict):
-        return (field_name in source, source.get(field_name))
+    # pylint: disable-next=unidiomatic-typecheck
+    if type(source) is dict or isinstance(source, dict):
+        value = source.get(field_name, _MISSING)
+    else:
+        value = getattr(source, field_name, _MISSING)
+
+    if value is _MISSING:
+        return (False, None)
+
+    return (True, value)
+
+
+def _copy_field_info(field_info: FieldInfo) -> FieldInfo:
+    """
+    Create an independent copy of a field definition.
 
-    if isinstance(source, BaseModel):
-        return (hasattr(source, field_name), getattr(source, field_name, None))
+    A shallow copy is much cheaper than a deep copy, only the mutable
+    collections are duplicated so the copy does not share them with the
+    original field.
 
-    return (False, None)
+    :param field_info: Field definition to copy.
+
+    :returns: New field definition.
+    """
+    new_field_info = copy(field_info)
+    for attr_name in ("metadata", "_attributes_set", "_qualifiers"):
+        if hasattr(field_info, attr_name):  # Missing on older pydantic releases.
+            setattr(new_field_info, attr_name, copy(getattr(field_info, attr_name)))
+    return new_field_info
 
 
 def _get_base_model_type(annotation: Any) -> Optional[type[BaseModel]]:
@@ -47,45 +77,58 @@ def _get_base_model_type(annotation: Any) -> Optional[type[BaseModel]]:
     :returns: BaseModel type extracted from annotation of None if nothing was
         found.
     """
-    origin = get_origin(annotation)
+    for current in _iter_annotation_types(annotation):
+        if isinstance(current, type) and issubclass(current, BaseModel):
+            return current
+
+    return None
 
-    if origin is Union:
-        for arg in get_args(annotation):
-            if model_type := _get_base_model_type(arg):
-                return model_type
-        return None
 
-    if origin in (list, dict, set, tuple):
-        if args := get_args(annotation):
-            for arg in args:
-                if model_type := _get_base_model_type(arg):
-                    return model_type
-        return None
+def _iter_annotation_types(annotation: Any) -> Iterator[Any]:
+    """
+    Iterate over the types held by an annotation.
 
-    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
-        return annotation
+    Annotation arguments are walked depth first with an explicit stack, so
+    deeply nested annotations do not hit the recursion limit.
 
-    return None
+    :param annotation: Source field annotation.
+
+    :returns: Iterator over the annotation types that are not Union,
+        Annotated or containers, from left to right.
+    """
+    stack: list[Any] = [annotation]
+    visited: set[int] = set()
+
+    while stack:
+        current = stack.pop()
+        if id(current) in visited:
+            continue
+        visited.add(id(current))
+
+        origin = get_origin(current)
+
+        if origin is Annotated:
+            stack.append(current.__args__[0])
+        elif origin is Union or origin in _CONTAINER_ORIGINS:
+            # Reversed, so arguments are searched from left to right.
+            stack.extend(reversed(getattr(current, "__args__", ())))
+        else:
+            yield current
 
 
 def _copy_source_value(
-    data: dict[str, Any],
+    source_values: Any,
     dest_values: dict[str, Any],
-    source_mappings: dict[type[BaseModel], str],
-    source_model_type: type[BaseModel],
-    field_mappings: dict[str, str],
+    field_mappings: FieldMappings,
 ):
     """
     Copy source value to destination linked field.
     """
-    if (source_field_name := source_mappings.get(source_model_type)) is None:
-        return
-
-    source_values = data.get(source_field_name)
-    if not isinstance(source_values, (dict, BaseModel)):
+    # pylint: disable-next=unidiomatic-typecheck
+    if type(source_values) is not dict and not isinstance(source_values, (dict, BaseModel)):
         return
 
-    for dest_field, source_field in field_mappings.items():
+    for dest_field, source_field in field_mappings:
         if dest_field in dest_values:
             continue  # Do not override user input values.
 
@@ -95,61 +138,142 @@ def _copy_source_value(
             dest_values[dest_field] = source_value
 
 
-def _copy_to_dest(
-    data: dict[str, Any],
-    source_mappings: dict[type[BaseModel], str],
-    dest_model_type: type[BaseModel],
-    dest_field_name: str,
-):
+@model_validator(mode="before")
+def _validate_linked_fields(cls, data: Any) -> Any:
     """
-    Check if destination have linked fields to copy and then proceed.
+    Validator function to copy linked fields.
+
+    Shared by every model using LinkModelMetaclass, the links to copy are
+    read from the model class.
     """
-    links: Optional[list[tuple[type[BaseModel], dict[str, str]]]] = getattr(
-        dest_model_type, "__link_model__", None)
-    if links is None:
-        return
+    if data.__class__ is not dict and not isinstance(data, dict):
+        return data
 
-    dest_values = data.get(dest_field_name)
+    # Link metadata is set in the class by LinkModelMetaclass, read it from
+    # the class dictionary to skip the attribute lookup machinery.
+    cls_dict = cls.__dict__
+    plan: Optional[LinkPlan] = cls_dict.get("__link_plan__")
+    if plan is None:
+        # Fields were not resolved yet when the class was created.
+        plan = _set_link_plan(cls)
+    if not plan:
+        return data
 
-    if isinstance(dest_values, dict):
-        for source_model_type, field_mappings in links:
-            _copy_source_value(
-                data,
-                dest_values,
-                source_mappings,
-                source_model_type,
-                field_mappings)
+    source_field_set: frozenset[str] = cls_dict["__link_source_field_set__"]
+    if source_field_set.isdisjoint(data):
+        return data  # No source values to copy from.
+
+    for source_field_name, dest_field_name, field_mappings in plan:
+        if (source_values := data.get(source_field_name)) is None:
+            continue
 
+        dest_values = data.get(dest_field_name)
+        # pylint: disable-next=unidiomatic-typecheck
+        if type(dest_values) is dict or isinstance(dest_values, dict):
+            _copy_source_value(source_values, dest_values, field_mappings)
 
-def _get_link_validator_func() -> ModelValidatorFunc:
+    return data
+
+
+def _get_fields_annotations(
+    bases: tuple[type[Any], ...],
+    annotations: dict[str, Any],
+) -> dict[str, Any]:
+    """
+    Get the annotations of every field of a class being created.
+
+    :param bases: Bases of the class being created, fields of every class in
+        their MRO are inherited, including non-model mixins.
+    :param annotations: Annotations dictionary of the class being created.
+
+    :returns: Dictionary mapping field names to their annotations.
+    """
+    fields: dict[str, Any] = {}
+    for base in reversed(bases):
+        for klass in reversed(base.__mro__):
+            if issubclass(klass, BaseModel):
+                fields.update(
+                    (field_name, field_info.annotation)
+                    for field_name, field_info in klass.model_fields.items())
+            else:
+                fields.update(vars(klass).get("__annotations__", {}))
+    fields.update(annotations)
+    return fields
+
+
+def _may_have_links(
+    bases: tuple[type[Any], ...],
+    annotations: dict[str, Any],
+) -> bool:
     """
-    Create link validator function.
+    Check if a class being created may have links to copy.
+
+    :param bases: Bases of the class being created, their fields are inherited.
+    :param annotations: Annotations dictionary of the class being created.
+
+    :returns: True if any field holds a BaseModel type or an unresolved
+        annotation, like postponed or quoted ones, that may hold one.
     """
+    for field_name, annotation in _get_fields_annotations(bases, annotations).items():
+        if field_name.startswith("_"):
+            continue  # Private attributes are not fields.
 
-    @model_validator(mode="before")
-    def validate_linked_fields(cls, data: Any) -> Any:
-        """
-        Validator function to copy linked fields.
-        """
-        if not isinstance(data, dict):
-            return data
+        for current in _iter_annotation_types(annotation):
+            if isinstance(current, (str, ForwardRef)):
+                return True
+            if isinstance(current, type) and issubclass(current, BaseModel):
+                return True
 
-        # Mapping BaseModel types to field names
-        source_mappings: dict[type[BaseModel], str] = {}
-        for field_name, field_def in cls.model_fields.items():
-            if model_type := _get_base_model_type(field_def.annotation):
-                source_mappings[model_type] = field_name
+    return False
 
-        for dest_model_type, dest_field_name in source_mappings.items():
-            _copy_to_dest(data, source_mappings, dest_model_type, dest_field_name)
 
-        return data
+def _create_link_plan(fields: dict[str, FieldInfo]) -> LinkPlan:
+    """
+    Flatten the links to copy during validation of a LinkModelMetaclass.
+
+    :param fields: Fields of the model, with resolved annotations.
+
+    :returns: Tuple of (source field name, destination field name, field
+        mappings) items.
+    """
+    # Mapping BaseModel types to field names
+    model_fields: list[tuple[str, type[BaseModel]]] = []
+    source_mappings: dict[type[BaseModel], str] = {}
+    for field_name, field_info in fields.items():
+        if model_type := _get_base_model_type(field_info.annotation):
+            field_name = intern(field_name)
+            model_fields.append((field_name, model_type))
+            source_mappings[model_type] = field_name
+
+    plan: list[tuple[str, str, FieldMappings]] = []
+    for dest_field_name, dest_model_type in model_fields:
+        links: tuple[tuple[type[BaseModel], FieldMappings], ...] = getattr(
+            dest_model_type, "__link_model__", ())
+
+        for source_model_type, field_mappings in links:
+            if (source_field_name := source_mappings.get(source_model_type)) is not None:
+                plan.append((source_field_name, dest_field_name, field_mappings))
+
+    return tuple(plan)
+
+
+def _set_link_plan(cls: type[BaseModel]) -> LinkPlan:
+    """
+    Resolve the links to copy and store them in the model class.
+
+    :param cls: Model class, its fields annotations must be resolved.
+
+    :returns: Link plan of the model class.
+    """
+    plan = _create_link_plan(cls.model_fields)
+    setattr(cls, "__link_plan__", plan)
+    setattr(cls, "__link_source_field_set__", frozenset(item[0] for item in plan))
+    return plan
 
-    return validate_linked_fields
 
 def _create_linked_fields(
     links: dict[str, Any],
-    link_model: list[tuple[type[BaseModel], dict[str, str]]],
+    link_model: list[tuple[type[BaseModel], FieldMappings]],
     annotations: dict[str, Any],
 ) -> dict[str, Any]:
     """
@@ -173,17 +297,17 @@ def _create_linked_fields(
         else:
             continue
 
-        link_attr: dict[str, str] = {}
+        link_attr: list[tuple[str, str]] = []
 
         for field_name in _fields:
-            key = f"{prefix}_{field_name}"
+            key = intern(f"{prefix}_{field_name}")
             field_info = _model.model_fields[field_name]
-            namespace[key] = deepcopy(field_info)
+            namespace[key] = _copy_field_info(field_info)
             annotations[key] = field_info.annotation
-            link_attr[key] = field_name
+            link_attr.append((key, intern(field_name)))
 
         if link_attr:
-            link_model.append((_model, link_attr))
+            link_model.append((_model, tuple(link_attr)))
 
     return namespace
 
@@ -206,17 +330,33 @@ class LinkModelMetaclass(_model_construction.ModelMetaclass):
         """
         Metaclass constructor.
         """
+        annotations = namespace.setdefault("__annotations__", {})
+        link_model: list[tuple[type[BaseModel], FieldMappings]] = [
+            link for base in bases for link in getattr(base, "__link_model__", ())]
         namespace.update(_create_linked_fields(
             namespace.pop("_links", {}),
-            namespace.setdefault("__link_model__", []),
-            namespace.setdefault("__annotations__", {})))
-
-        # Create a validator function to copy linked fields.
-        namespace[f"__link_validator_{cls_name}__"] = _get_link_validator_func()
-
-        return super().__new__(
+            link_model,
+            annotations))
+        # Resolve inherited links once, so lookups never need to walk the MRO.
+        namespace["__link_model__"] = tuple(dict.fromkeys(link_model))
+
+        # Register the shared validator function to copy linked fields, only
+        # when there may be links to copy and no parent class registered it yet.
+        if _may_have_links(bases, annotations) and not any(
+                f"__link_validator_{parent.__name__}__" in vars(parent)
+                for base in bases for parent in base.__mro__):
+            namespace[f"__link_validator_{cls_name}__"] = _validate_linked_fields
+
+        cls = super().__new__(
             mcs, cls_name, bases, namespace,
             __pydantic_generic_metadata__,
             __pydantic_reset_parent_namespace__,
             _create_model_module,
             **kwargs)
+
+        # Resolve the links to copy once, not on every validation. Models with
+        # unresolved forward references get it on their first validation.
+        if getattr(cls, "__pydantic_complete__", False):
+            _set_link_plan(cls)
+
+        return cls
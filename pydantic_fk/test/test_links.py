@@ -1,12 +1,14 @@
 
-from typing import Optional, Union
+from typing import Annotated, Optional, Union
 
 import pytest
 from pydantic import BaseModel, ValidationError
 from pydantic.fields import FieldInfo
 
 from ..links import LinkModelMetaclass
+from ..links import _copy_field_info
 from ..links import _get_base_model_type
+from ..links import _get_source_value
 
 
 class Foo(BaseModel):
@@ -41,6 +43,13 @@ class PartialBar(BaseModel, metaclass=LinkModelMetaclass):
     c: float
 
 
+class ChildBar(Bar):
+    """
+    Testing linked model inheriting links from Bar.
+    """
+    d: int = 0
+
+
 class AppConfig(BaseModel, metaclass=LinkModelMetaclass):
     """
     Testing Config App model.
@@ -65,6 +74,44 @@ class AppConfigOptional(BaseModel, metaclass=LinkModelMetaclass):
     bar: Bar
 
 
+class AppConfigChild(AppConfig):
+    """
+    Testing Config App model inheriting its fields.
+    """
+    name: str = "child"
+
+
+class AppConfigMixin:  # pylint: disable=too-few-public-methods
+    """
+    Testing non-model mixin declaring linked fields.
+    """
+    foo: Foo
+    bar: Bar
+
+
+class AppConfigFromMixin(AppConfigMixin, BaseModel, metaclass=LinkModelMetaclass):
+    """
+    Testing Config App model with fields declared by a mixin.
+    """
+
+
+class AppConfigMultiBar(BaseModel, metaclass=LinkModelMetaclass):
+    """
+    Testing Config App model with many fields of the same linked model.
+    """
+    foo: Foo
+    bar: Bar
+    other_bar: Bar
+
+
+class AppConfigChildBar(BaseModel, metaclass=LinkModelMetaclass):
+    """
+    Testing Config App model with inherited links.
+    """
+    foo: Foo
+    bar: ChildBar
+
+
 def test_helper_get_base_model_type():
     """
     Test _get_base_model_type function.
@@ -75,6 +122,15 @@ def test_helper_get_base_model_type():
     assert _get_base_model_type(Union[str, Foo]) is Foo
     assert _get_base_model_type(list[Foo]) is Foo
     assert _get_base_model_type(dict[str, Foo]) is Foo
+    assert _get_base_model_type(frozenset[Foo]) is Foo
+    assert _get_base_model_type(tuple[int, Foo]) is Foo
+    assert _get_base_model_type(Annotated[Foo, "x"]) is Foo
+    assert _get_base_model_type(list[Annotated[Foo, "x"]]) is Foo
+    assert _get_base_model_type(Optional[Annotated[Foo, "x"]]) is Foo
+    assert _get_base_model_type(Annotated[str, Foo]) is None
+    assert _get_base_model_type(Union[Foo, Bar]) is Foo
+    assert _get_base_model_type(Union[Bar, Foo]) is Bar
+    assert _get_base_model_type(list[dict[str, Optional[list[Foo]]]]) is Foo
     assert _get_base_model_type(str) is None
     assert _get_base_model_type(int) is None
     assert _get_base_model_type(Optional[str]) is None
@@ -83,6 +139,38 @@ def test_helper_get_base_model_type():
     assert _get_base_model_type(dict[str, int]) is None
 
 
+def test_helper_get_source_value():
+    """
+    Test _get_source_value function.
+    """
+
+    assert _get_source_value({"a": 1}, "a") == (True, 1)
+    assert _get_source_value({"a": None}, "a") == (True, None)
+    assert _get_source_value({"a": 1}, "b") == (False, None)
+    assert _get_source_value(Foo(a=1, b="test"), "b") == (True, "test")
+    assert _get_source_value(Foo(a=1, b="test"), "c") == (False, None)
+    assert _get_source_value(AppConfigOptional(bar={"c": 1.0, "f_a": 1, "f_b": ""}),
+                             "foo") == (True, None)
+
+
+def test_helper_copy_field_info():
+    """
+    Test _copy_field_info function.
+    """
+
+    # pylint: disable=unsubscriptable-object
+    field_info = Foo.model_fields["a"]
+    new_field_info = _copy_field_info(field_info)
+
+    assert new_field_info is not field_info
+    assert new_field_info.annotation is int
+    assert new_field_info.is_required()
+    for attr_name in ("metadata", "_attributes_set", "_qualifiers"):
+        if hasattr(field_info, attr_name):
+            assert getattr(new_field_info, attr_name) == getattr(field_info, attr_name)
+            assert getattr(new_field_info, attr_name) is not getattr(field_info, attr_name)
+
+
 def test_field_link():
     """
     Test field_link decorator.
@@ -140,3 +228,55 @@ def test_validate_link():
     assert cfg.bar.f_a == 4
     assert cfg.bar.f_b == "user-input"
     assert cfg.bar.c == 3.14159265
+
+
+def test_validate_link_many_dest():
+    """
+    Test linked fields copied to many fields of the same model.
+    """
+
+    cfg = AppConfigMultiBar.model_validate({
+        "foo": {"a": 7, "b": "many"},
+        "bar": {"c": 1.5},
+        "other_bar": {"c": 2.5, "f_a": 8}})
+    assert cfg.bar.f_a == 7
+    assert cfg.bar.f_b == "many"
+    assert cfg.other_bar.f_a == 8
+    assert cfg.other_bar.f_b == "many"
+
+
+def test_validate_link_inherited():
+    """
+    Test linked fields on models inheriting their fields.
+    """
+
+    cfg = AppConfigChild.model_validate({
+        "foo": {"a": 5, "b": "inherited"},
+        "bar": {"c": 1.5}})
+    assert cfg.bar.f_a == 5
+    assert cfg.bar.f_b == "inherited"
+    assert cfg.name == "child"
+
+    # The link validator is only registered once, and only when needed.
+    assert not Bar.__pydantic_decorators__.model_validators
+    assert list(AppConfigChild.__pydantic_decorators__.model_validators) == [
+        "__link_validator_AppConfig__"]
+
+    cfg = AppConfigChildBar.model_validate({
+        "foo": {"a": 6, "b": "inherited"},
+        "bar": {"c": 1.5}})
+    assert cfg.bar.f_a == 6
+    assert cfg.bar.f_b == "inherited"
+    assert cfg.bar.d == 0
+
+
+def test_validate_link_mixin():
+    """
+    Test linked fields declared by a non-model mixin.
+    """
+
+    cfg = AppConfigFromMixin.model_validate({
+        "foo": {"a": 9, "b": "mixin"},
+        "bar": {"c": 1.0}})
+    assert cfg.bar.f_a == 9
+    assert cfg.bar.f_b == "mixin"
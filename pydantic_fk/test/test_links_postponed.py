@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from pydantic import BaseModel
+
+from ..links import LinkModelMetaclass
+from .test_links import Bar, Foo
+
+
+class AppConfig(BaseModel, metaclass=LinkModelMetaclass):
+    """
+    Testing Config App model with postponed annotations.
+    """
+    foo: Foo
+    bar: Optional[Bar] = None
+
+
+class AppConfigDeferred(BaseModel, metaclass=LinkModelMetaclass):
+    """
+    Testing Config App model referencing a model defined later.
+    """
+    foo: Foo
+    bar: LateBar
+
+
+class LateBar(BaseModel, metaclass=LinkModelMetaclass):
+    """
+    Testing linked model defined after its first reference.
+    """
+    _links = {"f": (Foo, "a")}
+
+    c: float
+
+
+def test_validate_link_postponed():
+    """
+    Test linked fields with postponed annotations.
+    """
+
+    cfg = AppConfig.model_validate({
+        "foo": {"a": 1, "b": "postponed"},
+        "bar": {"c": 3.14159265}})
+    assert cfg.bar is not None
+    assert cfg.bar.f_a == 1
+    assert cfg.bar.f_b == "postponed"
+
+
+def test_validate_link_deferred():
+    """
+    Test linked fields with forward references resolved after class creation.
+    """
+
+    cfg = AppConfigDeferred.model_validate({
+        "foo": {"a": 2, "b": "deferred"},
+        "bar": {"c": 2.5}})
+    assert cfg.bar.f_a == 2
+    assert not hasattr(cfg.bar, "f_b")